@@ -6,4 +6,16 @@ STATIC_DIR = ROOT_DIR / "static"
 
 # Template directories
 MEME_TEMPLATES_DIR = STATIC_DIR / "meme_templates"
-OVERLAY_TEMPLATES_DIR = STATIC_DIR / "overlay_templates"
\ No newline at end of file
+OVERLAY_TEMPLATES_DIR = STATIC_DIR / "overlay_templates"
+GIF_TEMPLATES_DIR = STATIC_DIR / "gif_templates"
+
+# Preview rendering
+PREVIEW_MAX_SIZE = 720  # Longest edge of on-screen previews, in pixels
+PREVIEW_GIF_FRAMES = 8  # Number of leading GIF frames rendered for previews
+
+# Output encoding
+OUTPUT_FORMATS = ("PNG", "WEBP", "JPEG")
+DEFAULT_OUTPUT_FORMAT = "PNG"
+PNG_COMPRESS_LEVEL = 3  # 0-9; PIL's default of 6 is noticeably slower for little size gain
+WEBP_QUALITY = 90
+JPEG_QUALITY = 90
@@ -1,10 +1,16 @@
 from typing import Optional, Tuple, BinaryIO
 from PIL import Image, ImageSequence
-import io
+import time
+from itertools import islice
 from pathlib import Path
 
+from stan_meme_creator.config import PREVIEW_GIF_FRAMES, PREVIEW_MAX_SIZE
+from stan_meme_creator.core.render_result import EncodedGif
 from stan_meme_creator.utils.image_utils import find_transparent_area, resize_image_to_fit_area
 
+# Cheap filter used for previews; full renders keep PIL's default
+PREVIEW_RESAMPLE = Image.Resampling.BILINEAR
+
 class ImageProcessor:
     """Handles all image processing operations for the meme creator."""
     
@@ -12,15 +18,24 @@ class ImageProcessor:
     def process_image(
         user_image: Image.Image,
         template_path: str,
-        maintain_aspect_ratio: bool = False
+        maintain_aspect_ratio: bool = False,
+        preview: bool = False
     ) -> Image.Image | BinaryIO:
         """
         Process an image with the selected template.
         
+        Preview renders are composed at display resolution (longest edge
+        capped at PREVIEW_MAX_SIZE) with a cheap resampling filter, and GIF
+        previews only contain the first PREVIEW_GIF_FRAMES frames. The
+        transparent area is always located on the full-resolution template
+        and scaled by the same factor as the template, so the framing of a
+        preview matches the full render.
+        
         Args:
             user_image: The user's uploaded image
             template_path: Path to the template to apply
             maintain_aspect_ratio: Whether to maintain aspect ratio when fitting image
+            preview: Whether to render a fast, low-resolution preview
             
         Returns:
             Processed image or GIF binary stream
@@ -30,24 +45,63 @@ class ImageProcessor:
             raise ValueError("No transparent area found in template")
 
         if template_path.lower().endswith('.gif'):
-            return ImageProcessor._process_gif_template(user_image, template_path, area)
+            return ImageProcessor._process_gif_template(
+                user_image, template_path, area, preview
+            )
         else:
             return ImageProcessor._process_static_template(
-                user_image, template_path, area, maintain_aspect_ratio
+                user_image, template_path, area, maintain_aspect_ratio, preview
             )
 
+    @staticmethod
+    def _preview_scale(size: Tuple[int, int]) -> float:
+        """Get the downscale factor that fits a template into the preview size."""
+        return min(1.0, PREVIEW_MAX_SIZE / max(size))
+
+    @staticmethod
+    def _scale_area(
+        area: Tuple[int, int, int, int, int, int],
+        scale: float
+    ) -> Tuple[int, int, int, int, int, int]:
+        """
+        Scale a transparent area by the given factor.
+        
+        Edges are scaled and rounded individually so the scaled area stays
+        aligned with the scaled template.
+        """
+        if scale == 1.0:
+            return area
+        left, top, right, bottom = (round(int(v) * scale) for v in area[:4])
+        return left, top, right, bottom, max(1, right - left), max(1, bottom - top)
+
+    @staticmethod
+    def _scale_template(template: Image.Image, scale: float) -> Image.Image:
+        """Downscale a template frame for preview rendering."""
+        if scale == 1.0:
+            return template
+        size = (max(1, round(template.width * scale)), max(1, round(template.height * scale)))
+        return template.resize(size, PREVIEW_RESAMPLE)
+
     @staticmethod
     def _process_static_template(
         user_image: Image.Image,
         template_path: str,
         area: Tuple[int, int, int, int, int, int],
-        maintain_aspect_ratio: bool
+        maintain_aspect_ratio: bool,
+        preview: bool = False
     ) -> Image.Image:
         """Process a static image template."""
         with Image.open(template_path) as template:
             template = template.convert("RGBA")
+            resample = None
+            if preview:
+                scale = ImageProcessor._preview_scale(template.size)
+                area = ImageProcessor._scale_area(area, scale)
+                template = ImageProcessor._scale_template(template, scale)
+                resample = PREVIEW_RESAMPLE
+
             user_image_resized = resize_image_to_fit_area(
-                user_image, area[4], area[5], maintain_aspect_ratio
+                user_image, area[4], area[5], maintain_aspect_ratio, resample
             )
             
             base_layer = Image.new("RGBA", template.size)
@@ -60,14 +114,26 @@ class ImageProcessor:
     def _process_gif_template(
         user_image: Image.Image,
         template_path: str,
-        area: Tuple[int, int, int, int, int, int]
+        area: Tuple[int, int, int, int, int, int],
+        preview: bool = False
     ) -> BinaryIO:
         """Process a GIF template."""
         with Image.open(template_path) as template:
+            scale = 1.0
+            resample = None
+            frame_iter = ImageSequence.Iterator(template)
+            if preview:
+                scale = ImageProcessor._preview_scale(template.size)
+                area = ImageProcessor._scale_area(area, scale)
+                resample = PREVIEW_RESAMPLE
+                frame_iter = islice(frame_iter, PREVIEW_GIF_FRAMES)
+
+            # The user image is identical in every frame, so resize it once
+            user_image_resized = user_image.resize((area[4], area[5]), resample)
+
             frames = []
-            for frame in ImageSequence.Iterator(template):
-                frame = frame.convert("RGBA")
-                user_image_resized = user_image.resize((area[4], area[5]))
+            for frame in frame_iter:
+                frame = ImageProcessor._scale_template(frame.convert("RGBA"), scale)
                 
                 base_layer = Image.new("RGBA", frame.size)
                 base_layer.paste(user_image_resized, (area[0], area[1]))
@@ -76,7 +142,8 @@ class ImageProcessor:
                 
                 frames.append(base_layer)
             
-            gif_bytes_io = io.BytesIO()
+            start = time.perf_counter()
+            gif_bytes_io = EncodedGif()
             frames[0].save(
                 gif_bytes_io,
                 format='GIF',
@@ -86,6 +153,7 @@ class ImageProcessor:
                 duration=template.info.get('duration', 100),
                 optimize=False
             )
+            gif_bytes_io.encode_seconds = time.perf_counter() - start
             gif_bytes_io.seek(0)
             
             return gif_bytes_io 
\ No newline at end of file
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+from PIL import Image
+import base64
+import io
+import time
+
+from stan_meme_creator.config import (
+    DEFAULT_OUTPUT_FORMAT,
+    JPEG_QUALITY,
+    OUTPUT_FORMATS,
+    PNG_COMPRESS_LEVEL,
+    WEBP_QUALITY,
+)
+
+MIME_TYPES = {
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "JPEG": "image/jpeg",
+    "GIF": "image/gif",
+}
+
+# Formats st.image passes through unchanged; anything else it re-encodes
+ST_IMAGE_FORMATS = ("PNG", "JPEG", "GIF")
+
+class EncodedGif(io.BytesIO):
+    """GIF binary stream that records how long it took to encode."""
+
+    def __init__(self, data: bytes = b"", encode_seconds: Optional[float] = None):
+        super().__init__(data)
+        self.encode_seconds = encode_seconds
+
+@dataclass(frozen=True)
+class RenderResult:
+    """
+    A rendered meme encoded exactly once.
+    
+    The encoded bytes are shared between on-screen display and download so
+    the same image is never encoded twice per request.
+    """
+
+    data: bytes
+    format: str
+    width: int
+    height: int
+    encode_seconds: Optional[float] = None
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES[self.format]
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == "JPEG" else self.format.lower()
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.data)
+
+    @property
+    def st_image_compatible(self) -> bool:
+        """Whether st.image can display the bytes without re-encoding them."""
+        return self.format in ST_IMAGE_FORMATS
+
+    def to_base64(self) -> str:
+        """Get the encoded bytes as a base64 string."""
+        return base64.b64encode(self.data).decode()
+
+    def to_data_uri(self) -> str:
+        """Get the encoded bytes as a data URI for an <img> tag."""
+        return f"data:{self.mime_type};base64,{self.to_base64()}"
+
+    def summary(self) -> str:
+        """Get a short human-readable description of the encoding."""
+        summary = f"{self.format} · {self.size_bytes / 1024:.0f} KB"
+        if self.encode_seconds is not None:
+            summary += f" · encoded in {self.encode_seconds * 1000:.0f} ms"
+        return summary
+
+    @staticmethod
+    def from_image(image: Image.Image, format: str = DEFAULT_OUTPUT_FORMAT) -> "RenderResult":
+        """
+        Encode a PIL image.
+        
+        Args:
+            image: The image to encode
+            format: One of OUTPUT_FORMATS
+            
+        Returns:
+            Render result holding the encoded bytes
+        """
+        format = format.upper()
+        if format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {format}")
+
+        start = time.perf_counter()
+        buf = io.BytesIO()
+        if format == "PNG":
+            image.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        elif format == "WEBP":
+            image.save(buf, format="WEBP", quality=WEBP_QUALITY)
+        else:
+            # JPEG has no alpha channel
+            image.convert("RGB").save(buf, format="JPEG", quality=JPEG_QUALITY)
+        encode_seconds = time.perf_counter() - start
+
+        return RenderResult(buf.getvalue(), format, image.width, image.height, encode_seconds)
+
+    @staticmethod
+    def from_output(
+        output: Image.Image | BinaryIO,
+        format: str = DEFAULT_OUTPUT_FORMAT
+    ) -> "RenderResult":
+        """
+        Wrap the output of ImageProcessor.process_image.
+        
+        Static images are encoded in the requested format. GIF streams are
+        already encoded by the processor and are kept as-is, along with the
+        encode time it recorded.
+        
+        Args:
+            output: Processed image or GIF binary stream
+            format: Output format for static images
+            
+        Returns:
+            Render result holding the encoded bytes
+        """
+        if isinstance(output, Image.Image):
+            return RenderResult.from_image(output, format)
+
+        data = output.getvalue()
+        with Image.open(io.BytesIO(data)) as gif:
+            width, height = gif.size
+        return RenderResult(
+            data, "GIF", width, height, getattr(output, "encode_seconds", None)
+        )
@@ -1,7 +1,9 @@
 import streamlit as st
 from pathlib import Path
 from utils.meme_utils import MemeGenerator
-import io
+from config import DEFAULT_OUTPUT_FORMAT, OUTPUT_FORMATS
+from core.render_result import RenderResult
+from utils.display_utils import display_render_result
 
 # Page config
 st.set_page_config(
@@ -12,6 +14,11 @@ st.set_page_config(
 
 st.markdown("# AI Meme Generator 🤖")
 st.sidebar.header("AI Meme Generator")
+output_format = st.sidebar.selectbox(
+    "Output format",
+    OUTPUT_FORMATS,
+    index=OUTPUT_FORMATS.index(DEFAULT_OUTPUT_FORMAT)
+)
 
 # Initialize session state
 if 'current_batch' not in st.session_state:
@@ -51,20 +58,21 @@ def display_meme_batch(results, start_idx):
                 # Generate meme
                 meme_image = meme_gen.generate_meme(image_url, st.session_state.user_prompt)
                 
+                # Encode once for both display and download
+                result = RenderResult.from_image(meme_image, output_format)
+                
                 # Display result
-                st.image(meme_image, caption=f"Similarity: {similarity:.2f}", use_column_width=True)
+                display_render_result(result, caption=f"Similarity: {similarity:.2f}")
                 
                 # Add download button
-                buf = io.BytesIO()
-                meme_image.save(buf, format="PNG")
                 st.download_button(
                     label=f"Download Meme {idx + 1}",
-                    data=buf.getvalue(),
-                    file_name=f"generated_meme_{image_id}.png",
-                    mime="image/png",
+                    data=result.data,
+                    file_name=f"generated_meme_{image_id}.{result.extension}",
+                    mime=result.mime_type,
                     key=f"download_{idx}"
                 )
-                st.caption(f"Template ID: {image_id}")
+                st.caption(f"Template ID: {image_id} · {result.summary()}")
     
     # Show "Try More" button if there are more results
     remaining = len(results) - ((st.session_state.current_batch + 1) * 3)
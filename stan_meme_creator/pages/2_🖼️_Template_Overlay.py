@@ -7,7 +7,10 @@ from streamlit_cropper import st_cropper
 from streamlit_extras.stoggle import stoggle
 
 from core.image_processor import ImageProcessor
+from core.render_result import RenderResult
 from core.template_manager import TemplateManager
+from config import DEFAULT_OUTPUT_FORMAT, OUTPUT_FORMATS
+from utils.display_utils import display_render_result
 from utils.link_utils import twitter
 
 # Page configuration
@@ -84,6 +87,12 @@ def process_and_display_result(uploaded_file: str, template_img: str):
         # Image cropping options
         enable_cropping = st.toggle("Crop Image", value=False)
         maintain_aspect_ratio = st.toggle("Maintain Aspect Ratio", value=False)
+        output_format = st.selectbox(
+            "Output format",
+            OUTPUT_FORMATS,
+            index=OUTPUT_FORMATS.index(DEFAULT_OUTPUT_FORMAT),
+            help="GIF templates are always rendered as GIF"
+        )
         
         if enable_cropping:
             st.write("Double click to save crop")
@@ -93,24 +102,54 @@ def process_and_display_result(uploaded_file: str, template_img: str):
                 box_color='#0000FF'
             )
 
-        # Process the image
+        # Process the image as a fast preview; the full render is deferred
         try:
-            template_complete = ImageProcessor.process_image(
+            template_preview = ImageProcessor.process_image(
                 img,
                 template_img,
-                maintain_aspect_ratio=maintain_aspect_ratio
+                maintain_aspect_ratio=maintain_aspect_ratio,
+                preview=True
             )
-            st.image(
-                template_complete,
-                caption="Meme template with your image",
-                use_column_width=True
+            preview_result = RenderResult.from_output(template_preview, output_format)
+            display_render_result(
+                preview_result,
+                caption="Meme template with your image (preview)"
             )
             
+            display_download_button(img, template_img, maintain_aspect_ratio, output_format)
+
             # Twitter share button
             display_twitter_button()
         except ValueError as e:
             st.error(f"Error processing image: {str(e)}")
 
+def display_download_button(
+    img: Image.Image,
+    template_img: str,
+    maintain_aspect_ratio: bool,
+    output_format: str
+):
+    """Render the full-quality meme on request and offer it for download."""
+    if not st.button("Prepare full-quality download"):
+        return
+
+    with st.spinner("Rendering full-quality meme..."):
+        template_complete = ImageProcessor.process_image(
+            img,
+            template_img,
+            maintain_aspect_ratio=maintain_aspect_ratio
+        )
+
+        result = RenderResult.from_output(template_complete, output_format)
+
+    st.download_button(
+        label="Download Meme",
+        data=result.data,
+        file_name=f"stan_meme.{result.extension}",
+        mime=result.mime_type
+    )
+    st.caption(result.summary())
+
 def display_twitter_button():
     """Display Twitter share button."""
     components.html(
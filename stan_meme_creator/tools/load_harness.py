@@ -0,0 +1,506 @@
+"""
+Concurrent-session load test for the compositing and meme-search paths.
+
+Simulates N concurrent user sessions, each issuing a weighted mix of
+requests against the same code the pages call:
+
+- static: ImageProcessor.process_image with a PNG template, then encode
+- gif: ImageProcessor.process_image with a GIF template
+- caption: MemeGenerator.find_top_images followed by generate_meme, then encode
+
+Everything runs locally with no network access. Meme images are served by
+a stub HTTP server on 127.0.0.1, and the sentence transformer is replaced
+by a deterministic hashing embedding model. Sessions run as threads in one
+process, the same way Streamlit serves concurrent sessions.
+
+Example:
+    python -m stan_meme_creator.tools.load_harness --sessions 1 2 4 8 16
+"""
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from dataclasses import dataclass, field
+from PIL import Image
+import argparse
+import io
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import tempfile
+import threading
+import time
+import traceback
+import zlib
+
+import numpy as np
+
+from stan_meme_creator.config import (
+    DEFAULT_OUTPUT_FORMAT,
+    GIF_TEMPLATES_DIR,
+    MEME_TEMPLATES_DIR,
+    OUTPUT_FORMATS,
+    OVERLAY_TEMPLATES_DIR,
+    ROOT_DIR,
+)
+from stan_meme_creator.core.image_processor import ImageProcessor
+from stan_meme_creator.core.render_result import RenderResult
+from stan_meme_creator.utils.image_utils import find_transparent_area
+from stan_meme_creator.utils.meme_utils import MemeGenerator
+
+logger = logging.getLogger(__name__)
+
+DATA_PATH = ROOT_DIR / "data" / "meme_data.json"
+REQUEST_KINDS = ("static", "gif", "caption")
+DEFAULT_MIX = "static=5,gif=2,caption=3"
+
+PROMPTS = [
+    "Drake ignoring work and pointing at memes",
+    "Distracted boyfriend looking at crypto",
+    "Mind blown reaction to $STAN",
+    "when the market dumps right after you buy",
+    "boss walking in on a meeting that could have been an email",
+    "me explaining the cup that fucks to my parents",
+    "crying and laughing at the same time",
+    "this is fine while everything burns",
+]
+
+# Typical upload and meme library image sizes
+USER_IMAGE_SIZES = [(640, 480), (1080, 1080), (1920, 1080), (3024, 4032)]
+STUB_IMAGE_SIZE = (800, 800)
+
+
+class _StubTensor(np.ndarray):
+    """numpy array exposing the torch tensor methods MemeGenerator calls."""
+
+    def cpu(self) -> "_StubTensor":
+        return self
+
+    def numpy(self) -> np.ndarray:
+        return np.asarray(self)
+
+
+class StubEmbeddingModel:
+    """
+    Deterministic stand-in for SentenceTransformer.
+
+    Embeds text as a normalised bag of hashed word tokens, so prompts that
+    share words with a meme's tags still rank it higher.
+    """
+
+    def __init__(self, dimensions: int = 384, delay_ms: float = 0.0):
+        self.dimensions = dimensions
+        self.delay_ms = delay_ms
+
+    def encode(self, text: str, convert_to_tensor: bool = False) -> _StubTensor:
+        if self.delay_ms:
+            # Model inference runs outside the GIL, so sleeping is a fair proxy
+            time.sleep(self.delay_ms / 1000)
+
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in re.findall(r"\w+", text.lower()):
+            vector[zlib.crc32(token.encode()) % self.dimensions] += 1.0
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        else:
+            vector[0] = 1.0
+        return vector.view(_StubTensor)
+
+
+class StubImageServer:
+    """Serves generated meme library images from memory on 127.0.0.1."""
+
+    def __init__(self):
+        bodies = {
+            ".png": _encode_stub_image("PNG"),
+            ".jpg": _encode_stub_image("JPEG"),
+            ".jpeg": _encode_stub_image("JPEG"),
+            ".gif": _encode_stub_image("GIF"),
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                extension = os.path.splitext(self.path)[1].lower()
+                body = bodies.get(extension, bodies[".png"])
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubImageServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _encode_stub_image(format: str) -> bytes:
+    """Encode a noisy gradient so compression behaves like a real photo."""
+    width, height = STUB_IMAGE_SIZE
+    rng = np.random.default_rng(0)
+    gradient = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+    pixels = gradient + rng.normal(0, 40, (height, width, 3))
+    image = Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), "RGB")
+    buf = io.BytesIO()
+    image.save(buf, format=format)
+    return buf.getvalue()
+
+
+def _make_user_image(size: Tuple[int, int], seed: int) -> Image.Image:
+    """Create a synthetic user upload of the given size."""
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, (size[1] // 8, size[0] // 8, 3), dtype=np.uint8)
+    return Image.fromarray(pixels, "RGB").resize(size, Image.Resampling.BILINEAR)
+
+
+def _usable_templates(paths: List[str]) -> List[str]:
+    """Keep only templates that have a transparent area to composite into."""
+    return [p for p in paths if find_transparent_area(p)]
+
+
+def _write_local_meme_data(base_url: str, directory: str) -> str:
+    """
+    Write a copy of the meme data with image URLs pointing at the stub server.
+
+    Entries without an image are dropped, since they cannot be rendered.
+    """
+    with open(DATA_PATH) as f:
+        meme_data = json.load(f)
+
+    local_data = [
+        {**meme, "images": f"{base_url}/memelibrary/{meme['images'].rsplit('/', 1)[-1]}"}
+        for meme in meme_data
+        if meme.get("images")
+    ]
+    path = os.path.join(directory, "meme_data.json")
+    with open(path, "w") as f:
+        json.dump(local_data, f)
+    return path
+
+
+def _parse_mix(mix: str) -> Dict[str, float]:
+    """Parse a request mix such as 'static=5,gif=2,caption=3'."""
+    weights = {}
+    for part in mix.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in REQUEST_KINDS:
+            raise ValueError(f"Unknown request kind in mix: {kind}")
+        weights[kind] = float(weight or 1)
+    if not any(weights.values()):
+        raise ValueError("Request mix must have at least one positive weight")
+    return weights
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Get a percentile from sorted values by linear interpolation."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    return statistics.quantiles(sorted_values, n=100, method="inclusive")[int(percent) - 1]
+
+
+class _RssSampler:
+    """Samples the resident set size of this process in the background."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def current_bytes() -> int:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_bytes = max(self.peak_bytes, self.current_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "_RssSampler":
+        self.peak_bytes = self.current_bytes()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+@dataclass
+class LevelResult:
+    """Measurements for one concurrency level."""
+
+    sessions: int
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_bytes: int
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    error_tracebacks: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return sum(len(v) for v in self.latencies.values())
+
+    def summary(self) -> dict:
+        """Get the level's latency, throughput and resource figures."""
+        def latency_stats(values: List[float], errors: int) -> dict:
+            if not values:
+                return {"count": 0, "errors": errors}
+            values = sorted(values)
+            return {
+                "count": len(values),
+                "errors": errors,
+                "p50_ms": _percentile(values, 50) * 1000,
+                "p95_ms": _percentile(values, 95) * 1000,
+                "p99_ms": _percentile(values, 99) * 1000,
+            }
+
+        all_latencies = [v for values in self.latencies.values() for v in values]
+        return {
+            "sessions": self.sessions,
+            "requests": self.requests,
+            "errors": sum(self.errors.values()),
+            "throughput_rps": self.requests / self.wall_seconds,
+            "cpu_cores": self.cpu_seconds / self.wall_seconds,
+            "cpu_percent": 100 * self.cpu_seconds / self.wall_seconds / (os.cpu_count() or 1),
+            "peak_rss_mb": self.peak_rss_bytes / 2**20,
+            "overall": latency_stats(all_latencies, sum(self.errors.values())),
+            "by_kind": {
+                kind: latency_stats(self.latencies.get(kind, []), self.errors.get(kind, 0))
+                for kind in sorted(set(self.latencies) | set(self.errors))
+            },
+            "error_tracebacks": dict(self.error_tracebacks),
+        }
+
+
+class LoadTest:
+    """Drives concurrent simulated sessions against the rendering paths."""
+
+    def __init__(
+        self,
+        meme_gen: MemeGenerator,
+        static_templates: List[str],
+        gif_templates: List[str],
+        mix: Dict[str, float],
+        output_format: str = DEFAULT_OUTPUT_FORMAT,
+        preview: bool = False,
+        think_time: float = 0.0,
+        seed: int = 0
+    ):
+        self.meme_gen = meme_gen
+        self.templates = {"static": static_templates, "gif": gif_templates}
+        # Drop request kinds that have nothing to run against
+        self.mix = {
+            kind: weight for kind, weight in mix.items()
+            if weight > 0 and (kind == "caption" or self.templates[kind])
+        }
+        if not self.mix:
+            raise ValueError("No runnable request kinds in mix")
+        self.output_format = output_format
+        self.preview = preview
+        self.think_time = think_time
+        self.seed = seed
+        self.user_images = [
+            _make_user_image(size, seed + i) for i, size in enumerate(USER_IMAGE_SIZES)
+        ]
+
+    def run_request(self, kind: str, rng: random.Random):
+        """Run a single request of the given kind."""
+        if kind == "caption":
+            prompt = rng.choice(PROMPTS)
+            image_url, _, _ = self.meme_gen.find_top_images(prompt, n=3)[0]
+            meme_image = self.meme_gen.generate_meme(image_url, prompt)
+            RenderResult.from_image(meme_image, self.output_format)
+            return
+
+        output = ImageProcessor.process_image(
+            rng.choice(self.user_images),
+            rng.choice(self.templates[kind]),
+            maintain_aspect_ratio=rng.random() < 0.5,
+            preview=self.preview
+        )
+        RenderResult.from_output(output, self.output_format)
+
+    def warm_up(self):
+        """Run one request of each kind so lazy initialisation is not measured."""
+        rng = random.Random(self.seed)
+        for kind in self.mix:
+            try:
+                self.run_request(kind, rng)
+            except Exception:
+                logger.exception("Warm-up %s request failed", kind)
+
+    def _run_session(self, session_id: int, requests: int, result: LevelResult, lock: threading.Lock):
+        rng = random.Random(self.seed * 100003 + session_id)
+        kinds, weights = zip(*self.mix.items())
+        for _ in range(requests):
+            kind = rng.choices(kinds, weights)[0]
+            start = time.perf_counter()
+            try:
+                self.run_request(kind, rng)
+            except Exception:
+                with lock:
+                    result.errors[kind] = result.errors.get(kind, 0) + 1
+                    first_failure = kind not in result.error_tracebacks
+                    if first_failure:
+                        result.error_tracebacks[kind] = traceback.format_exc()
+                if first_failure:
+                    logger.error(
+                        "First %s failure with %d sessions:\n%s",
+                        kind, result.sessions, result.error_tracebacks[kind]
+                    )
+            else:
+                elapsed = time.perf_counter() - start
+                with lock:
+                    result.latencies.setdefault(kind, []).append(elapsed)
+            if self.think_time:
+                time.sleep(rng.expovariate(1 / self.think_time))
+
+    def run_level(self, sessions: int, requests_per_session: int) -> LevelResult:
+        """Run N concurrent sessions to completion and collect measurements."""
+        lock = threading.Lock()
+        cpu_start = sum(os.times()[:2])
+        wall_start = time.perf_counter()
+        with _RssSampler() as sampler:
+            result = LevelResult(sessions, 0.0, 0.0, 0)
+            with ThreadPoolExecutor(max_workers=sessions) as pool:
+                futures = [
+                    pool.submit(self._run_session, i, requests_per_session, result, lock)
+                    for i in range(sessions)
+                ]
+                for future in futures:
+                    future.result()
+        result.wall_seconds = time.perf_counter() - wall_start
+        result.cpu_seconds = sum(os.times()[:2]) - cpu_start
+        result.peak_rss_bytes = sampler.peak_bytes
+        return result
+
+
+def format_report(summaries: List[dict]) -> str:
+    """
+    Format level summaries as a plain-text table.
+
+    Every level gets an 'all' row, and every request kind that succeeded or
+    failed gets its own row. Levels with failed requests are flagged.
+    """
+    header = (
+        f"{'sessions':>8} {'kind':>8} {'count':>6} {'errors':>6} {'p50 ms':>9} "
+        f"{'p95 ms':>9} {'p99 ms':>9} {'req/s':>7} {'cpu %':>6} {'rss MB':>7}"
+    )
+    lines = [header, "-" * len(header)]
+    for summary in summaries:
+        rows = [("all", summary["overall"])] + list(summary["by_kind"].items())
+        for kind, stats in rows:
+            line = f"{summary['sessions']:>8} {kind:>8} {stats['count']:>6} {stats['errors']:>6}"
+            if stats["count"]:
+                line += (
+                    f" {stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f}"
+                )
+            else:
+                line += f" {'-':>9} {'-':>9} {'-':>9}"
+            if kind == "all":
+                line += (
+                    f" {summary['throughput_rps']:>7.2f} {summary['cpu_percent']:>6.0f}"
+                    f" {summary['peak_rss_mb']:>7.0f}"
+                )
+                if summary["errors"]:
+                    line += f"  !! {summary['errors']} FAILED REQUESTS"
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=_positive_int, nargs="+", default=[1, 2, 4, 8],
+                        help="Concurrency levels to run, one after another")
+    parser.add_argument("--requests-per-session", type=_positive_int, default=10,
+                        help="Requests each simulated session issues")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help="Weighted request mix, e.g. 'static=5,gif=2,caption=3'")
+    parser.add_argument("--format", default=DEFAULT_OUTPUT_FORMAT, choices=OUTPUT_FORMATS,
+                        help="Output encoding for static renders")
+    parser.add_argument("--preview", action="store_true",
+                        help="Render low-resolution previews instead of full renders")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Mean pause between a session's requests, in seconds")
+    parser.add_argument("--embedding-delay-ms", type=float, default=0.0,
+                        help="Simulated inference time of the stub embedding model")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    mix = _parse_mix(args.mix)
+
+    # Never let the stub server traffic go through a proxy
+    no_proxy = os.environ.get("NO_PROXY", "")
+    os.environ["NO_PROXY"] = ",".join(filter(None, [no_proxy, "127.0.0.1", "localhost"]))
+
+    static_templates = _usable_templates(
+        sorted(str(p) for d in (MEME_TEMPLATES_DIR, OVERLAY_TEMPLATES_DIR) for p in d.glob("*.png"))
+    )
+    gif_templates = _usable_templates(sorted(str(p) for p in GIF_TEMPLATES_DIR.glob("*.gif")))
+
+    with StubImageServer() as server, tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = _write_local_meme_data(server.base_url, tmp_dir)
+        model = StubEmbeddingModel(delay_ms=args.embedding_delay_ms)
+        load_test = LoadTest(
+            MemeGenerator(data_path, model=model),
+            static_templates,
+            gif_templates,
+            mix,
+            output_format=args.format,
+            preview=args.preview,
+            think_time=args.think_time,
+            seed=args.seed
+        )
+        load_test.warm_up()
+
+        summaries = []
+        for sessions in args.sessions:
+            result = load_test.run_level(sessions, args.requests_per_session)
+            summaries.append(result.summary())
+
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+    else:
+        print(format_report(summaries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import streamlit as st
+
+from stan_meme_creator.core.render_result import RenderResult
+
+def display_render_result(result: RenderResult, caption: str):
+    """
+    Display a render result without encoding it again.
+    
+    st.image re-encodes formats it does not pass through (e.g. WebP) as
+    JPEG, so those are embedded in an <img> tag as-is instead.
+    
+    Args:
+        result: The encoded render to display
+        caption: Caption shown under the image
+    """
+    if result.st_image_compatible:
+        st.image(result.data, caption=caption, use_column_width=True)
+    else:
+        st.markdown(
+            f'<img src="{result.to_data_uri()}" style="width: 100%;">',
+            unsafe_allow_html=True
+        )
+        st.caption(caption)
@@ -38,7 +38,8 @@ def resize_image_to_fit_area(
     image: Image.Image,
     area_width: int,
     area_height: int,
-    maintain_aspect_ratio: bool = True
+    maintain_aspect_ratio: bool = True,
+    resample: Optional[int] = None
 ) -> Image.Image:
     """
     Resize an image to fit into a specified area.
@@ -48,6 +49,7 @@ def resize_image_to_fit_area(
         area_width: Target width
         area_height: Target height
         maintain_aspect_ratio: Whether to maintain the original aspect ratio
+        resample: Optional PIL resampling filter (defaults to PIL's own choice)
         
     Returns:
         Resized image
@@ -61,10 +63,10 @@ def resize_image_to_fit_area(
             target_height = area_height
             target_width = int((img_width * area_height) / img_height)
         
-        image_resized = image.resize((target_width, target_height))
+        image_resized = image.resize((target_width, target_height), resample)
         new_image = Image.new("RGBA", (area_width, area_height), (0, 0, 0, 0))
         paste_position = ((area_width - target_width) // 2, (area_height - target_height) // 2)
         new_image.paste(image_resized, paste_position)
         return new_image
     
-    return image.resize((area_width, area_height)) 
\ No newline at end of file
+    return image.resize((area_width, area_height), resample)
\ No newline at end of file
@@ -1,23 +1,35 @@
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple
 import json
 from pathlib import Path
 import requests
 from PIL import Image, ImageDraw, ImageFont
 import io
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from textwrap import wrap
 import re
 from urllib.parse import unquote
-import base64
+
+from stan_meme_creator.config import DEFAULT_OUTPUT_FORMAT
+from stan_meme_creator.core.render_result import RenderResult
 
 class MemeGenerator:
-    def __init__(self, data_path: str):
-        """Initialize MemeGenerator with path to meme data JSON."""
+    def __init__(self, data_path: str, model: Optional[Any] = None):
+        """
+        Initialize MemeGenerator with path to meme data JSON.
+        
+        Args:
+            data_path: Path to the meme data JSON
+            model: Optional embedding model, i.e. an object with a
+                SentenceTransformer-style encode(); defaults to all-MiniLM-L6-v2
+        """
         self.data_path = data_path
         self.meme_data = self._load_meme_data()
         # Load the sentence transformer model
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        if model is None:
+            # Imported here so callers passing their own model don't need torch
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.model = model
         # Pre-compute embeddings for all tags
         self.tag_embeddings = self._compute_tag_embeddings()
 
@@ -217,15 +229,16 @@ class MemeGenerator:
         return results
 
     @staticmethod
-    def prepare_meme_data(image_url: str) -> dict:
+    def prepare_meme_data(image_url: str, format: str = DEFAULT_OUTPUT_FORMAT) -> dict:
         """
         Prepare image data for the interactive editor without applying text.
         
         Args:
             image_url: URL of the image
+            format: Output format used to encode the image
             
         Returns:
-            Dictionary with image data and dimensions
+            Dictionary with image data, dimensions and encoding details
         """
         # Download image
         response = requests.get(image_url)
@@ -235,13 +248,14 @@ class MemeGenerator:
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
             
-        # Convert to base64 for frontend
-        buffered = io.BytesIO()
-        img.save(buffered, format="PNG")
-        img_str = base64.b64encode(buffered.getvalue()).decode()
+        # Encode once and convert to base64 for frontend
+        result = RenderResult.from_image(img, format)
         
         return {
-            "image": img_str,
-            "width": img.width,
-            "height": img.height
+            "image": result.to_base64(),
+            "width": result.width,
+            "height": result.height,
+            "mime_type": result.mime_type,
+            "size_bytes": result.size_bytes,
+            "encode_seconds": result.encode_seconds
         }
\ No newline at end of file
@@ -0,0 +1,63 @@
+from PIL import Image, ImageChops
+import pytest
+
+from stan_meme_creator.config import GIF_TEMPLATES_DIR, OVERLAY_TEMPLATES_DIR, PREVIEW_GIF_FRAMES
+from stan_meme_creator.core.image_processor import ImageProcessor
+from stan_meme_creator.utils.image_utils import find_transparent_area
+
+STATIC_TEMPLATE = str(OVERLAY_TEMPLATES_DIR / "Front white.png")
+GIF_TEMPLATE = str(GIF_TEMPLATES_DIR / "Running sideways 25.gif")
+
+
+def pasted_region(template_path: str, size: tuple, maintain_aspect_ratio: bool, preview: bool):
+    """
+    Get the bounding box of the visible user image in a render.
+
+    Renders the template with two differently coloured user images; the
+    pixels that differ are exactly the ones showing the user image.
+    """
+    renders = [
+        ImageProcessor.process_image(
+            Image.new("RGB", size, color), template_path, maintain_aspect_ratio, preview
+        ).convert("RGB")
+        for color in ((255, 0, 0), (0, 0, 255))
+    ]
+    return renders[0].size, ImageChops.difference(*renders).getbbox()
+
+
+@pytest.mark.parametrize("size, maintain_aspect_ratio", [
+    ((400, 400), False),
+    ((1600, 900), True),
+    ((900, 1600), True),
+])
+def test_preview_framing_matches_full_render(size, maintain_aspect_ratio):
+    full_size, full_box = pasted_region(STATIC_TEMPLATE, size, maintain_aspect_ratio, False)
+    preview_size, preview_box = pasted_region(STATIC_TEMPLATE, size, maintain_aspect_ratio, True)
+
+    scale = ImageProcessor._preview_scale(full_size)
+    assert scale < 1.0
+    assert preview_size == (round(full_size[0] * scale), round(full_size[1] * scale))
+    for full_edge, preview_edge in zip(full_box, preview_box):
+        assert abs(full_edge * scale - preview_edge) <= 1
+
+
+def test_scaled_area_lines_up_with_scaled_template():
+    area = find_transparent_area(STATIC_TEMPLATE)
+    with Image.open(STATIC_TEMPLATE) as template:
+        scale = ImageProcessor._preview_scale(template.size)
+
+    scaled = ImageProcessor._scale_area(area, scale)
+    for edge, scaled_edge in zip(area[:4], scaled[:4]):
+        assert abs(edge * scale - scaled_edge) <= 1
+    assert scaled[4] == scaled[2] - scaled[0]
+    assert scaled[5] == scaled[3] - scaled[1]
+
+
+def test_gif_preview_frames_and_duration():
+    output = ImageProcessor.process_image(Image.new("RGB", (400, 400)), GIF_TEMPLATE, preview=True)
+
+    with Image.open(GIF_TEMPLATE) as template, Image.open(output) as preview:
+        assert template.n_frames > PREVIEW_GIF_FRAMES
+        assert preview.n_frames == PREVIEW_GIF_FRAMES
+        assert preview.info["duration"] == template.info["duration"]
+        assert max(preview.size) == round(max(template.size) * ImageProcessor._preview_scale(template.size))
@@ -0,0 +1,96 @@
+from pathlib import Path
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from stan_meme_creator.tools.load_harness import (
+    LevelResult,
+    StubEmbeddingModel,
+    _parse_mix,
+    _percentile,
+    format_report,
+    parse_args,
+)
+
+
+def test_parse_mix():
+    assert _parse_mix("static=5, gif=2,caption") == {"static": 5.0, "gif": 2.0, "caption": 1.0}
+
+
+def test_parse_mix_rejects_unknown_kind():
+    with pytest.raises(ValueError, match="Unknown request kind"):
+        _parse_mix("static=1,video=2")
+
+
+def test_parse_mix_rejects_all_zero_weights():
+    with pytest.raises(ValueError, match="positive weight"):
+        _parse_mix("static=0,gif=0")
+
+
+def test_percentile_single_value():
+    assert _percentile([0.25], 50) == _percentile([0.25], 99) == 0.25
+
+
+def test_percentile_known_quantiles():
+    values = [float(v) for v in range(1, 102)]
+    assert _percentile(values, 50) == pytest.approx(51)
+    assert _percentile(values, 95) == pytest.approx(96)
+    assert _percentile(values, 99) == pytest.approx(100)
+
+
+@pytest.mark.parametrize("option", ["--sessions", "--requests-per-session"])
+@pytest.mark.parametrize("value", ["0", "-1", "two"])
+def test_parse_args_rejects_non_positive_counts(option, value):
+    with pytest.raises(SystemExit):
+        parse_args([option, value])
+
+
+def test_summary_with_only_errors():
+    summary = LevelResult(4, 1.0, 1.0, 100, {"static": [0.1, 0.2]}, {"gif": 12}).summary()
+
+    assert summary["requests"] == 2
+    assert summary["errors"] == 12
+    assert summary["overall"]["errors"] == 12
+    assert summary["by_kind"]["gif"] == {"count": 0, "errors": 12}
+    assert summary["by_kind"]["static"]["count"] == 2
+
+
+def test_format_report_shows_failed_levels_and_kinds():
+    summaries = [
+        LevelResult(4, 1.0, 1.0, 100, {}, {"gif": 12}).summary(),
+        LevelResult(2, 1.0, 0.5, 100, {"static": [0.1, 0.2]}, {}).summary(),
+    ]
+    rows = [line.split() for line in format_report(summaries).splitlines()[2:]]
+
+    assert [row[:2] for row in rows if row[1] == "all"] == [["4", "all"], ["2", "all"]]
+    assert ["4", "gif", "0", "12", "-", "-", "-"] in rows
+    failed_all_row = next(row for row in rows if row[:2] == ["4", "all"])
+    assert failed_all_row[-4:] == ["!!", "12", "FAILED", "REQUESTS"]
+    assert "!!" not in next(row for row in rows if row[:2] == ["2", "all"])
+
+
+def test_stub_embedding_is_unit_length_and_repeatable():
+    model = StubEmbeddingModel()
+    vector = model.encode("Drake pointing at memes", convert_to_tensor=True)
+
+    assert np.linalg.norm(vector.cpu().numpy()) == pytest.approx(1.0)
+    assert np.array_equal(vector, model.encode("Drake pointing at memes"))
+    assert not np.array_equal(vector, model.encode("crying and laughing"))
+
+
+def test_stub_embedding_is_deterministic_across_runs():
+    code = (
+        "from stan_meme_creator.tools.load_harness import StubEmbeddingModel; "
+        "print(StubEmbeddingModel().encode('Drake pointing at memes').tolist())"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={"PYTHONHASHSEED": seed, "PYTHONPATH": str(Path(__file__).parent.parent)},
+            capture_output=True, text=True, check=True
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
@@ -0,0 +1,30 @@
+from PIL import Image
+import io
+import pytest
+
+from stan_meme_creator.config import GIF_TEMPLATES_DIR, OUTPUT_FORMATS
+from stan_meme_creator.core.image_processor import ImageProcessor
+from stan_meme_creator.core.render_result import RenderResult
+
+
+@pytest.mark.parametrize("format", OUTPUT_FORMATS)
+def test_from_image_round_trips(format):
+    result = RenderResult.from_image(Image.new("RGBA", (64, 48), (255, 0, 0, 255)), format)
+
+    with Image.open(io.BytesIO(result.data)) as decoded:
+        assert decoded.format == format
+        assert decoded.size == (result.width, result.height) == (64, 48)
+    assert result.encode_seconds is not None
+    assert result.to_data_uri().startswith(f"data:{result.mime_type};base64,")
+    assert result.st_image_compatible == (format != "WEBP")
+
+
+def test_gif_output_keeps_encode_time():
+    output = ImageProcessor.process_image(
+        Image.new("RGB", (100, 100)), str(GIF_TEMPLATES_DIR / "Running sideways 25.gif"), preview=True
+    )
+    result = RenderResult.from_output(output, "WEBP")
+
+    assert result.format == "GIF"
+    assert result.encode_seconds is not None and result.encode_seconds > 0
+    assert "encoded in" in result.summary()